@@ -63,6 +63,7 @@ CREATE INDEX idx_tx_sender     ON transactions(sender_id);
 CREATE INDEX idx_tx_receiver   ON transactions(receiver_id);
 CREATE INDEX idx_tx_ref        ON transactions(tx_ref);
 CREATE INDEX idx_tx_cat_time   ON transactions(category_id, timestamp);
+CREATE INDEX idx_tx_amount     ON transactions(amount);
 
 -- ============================================================
 -- Labels — tags you can assign to transactions
@@ -10,7 +10,18 @@ This script replaces the old CSV parser. It:
 
 import json
 import os
+import platform
 import time
+from bisect import bisect_left
+from itertools import repeat
+
+# Use orjson when it's installed and usable (CPython only), otherwise json
+orjson = None
+if platform.python_implementation() == 'CPython':
+    try:
+        import orjson
+    except ImportError:
+        pass
 
 
 def parse_source_json(source_path, output_path):
@@ -19,12 +30,14 @@ def parse_source_json(source_path, output_path):
     """
     print(f"Reading source data from: {source_path}")
     
-    with open(source_path, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
+    with open(source_path, 'rb') as f:
+        raw_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
 
-    transactions = []
+    # The record count is known up front, so size the list once instead of
+    # growing it with append()
+    transactions = [None] * len(raw_data)
 
-    for item in raw_data:
+    for index, item in enumerate(raw_data):
         # Transform flat structure into nested structure (simulating parsing logic)
         transaction = {
             "id": int(item["id"]),
@@ -44,24 +57,66 @@ def parse_source_json(source_path, output_path):
             "timestamp": item["timestamp"],
             "description": item["description"]
         }
-        transactions.append(transaction)
+        transactions[index] = transaction
 
     # Write the structured list to the final output file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(transactions, f, indent=2, ensure_ascii=False)
+    write_transactions(transactions, output_path)
 
     return transactions
 
 
+def write_transactions(transactions, output_path):
+    """
+    Saves the transactions as an indented JSON array.
+
+    The records are encoded and written one at a time, so the whole file
+    never has to be held in memory as one big string before writing.
+    """
+    if orjson is None:
+        # json.dump already encodes and writes in small chunks
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(transactions, f, indent=2, ensure_ascii=False)
+        return
+
+    with open(output_path, 'wb') as f:
+        if not transactions:
+            f.write(b'[]')
+            return
+
+        separator = b'[\n  '
+        for txn in transactions:
+            f.write(separator)
+            # Indent each record one level to get the same layout as
+            # json.dump(indent=2); encoded JSON strings never contain raw
+            # newlines. The JSON is equivalent, not always identical bytes:
+            # orjson formats some floats differently (1e16 vs 1e+16)
+            f.write(orjson.dumps(txn, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+            separator = b',\n  '
+        f.write(b'\n]')
+
+
 # ============================================================
 # DSA SECTION: Comparing search algorithms
 # ============================================================
 
-def binary_search_by_amount(sorted_list, target_amount):
+# How many times each search runs in the timing comparison
+BENCHMARK_ITERATIONS = 10000
+
+def binary_search_by_amount(sorted_list, target_amount, amounts=None):
     """
     Binary Search — O(log n) time complexity
     Works only on a SORTED list.
+
+    If `amounts` (the amounts of sorted_list, extracted once in the same
+    order) is given, the search runs in C via the bisect module on that
+    flat list instead of looking up txn["amount"] at every step.
     """
+    if amounts is not None:
+        index = bisect_left(amounts, target_amount)
+        if index < len(amounts) and amounts[index] == target_amount:
+            return sorted_list[index]
+        return None
+
     low = 0
     high = len(sorted_list) - 1
 
@@ -86,10 +141,20 @@ def dict_lookup_by_id(transactions_dict, txn_id):
     return transactions_dict.get(txn_id, None)
 
 
-def linear_search_by_id(transactions_list, txn_id):
+def linear_search_by_id(transactions_list, txn_id, ids=None):
     """
     Linear Search — O(n) time complexity
+
+    If `ids` (the IDs of transactions_list, extracted once in the same
+    order) is given, the scan runs in C via list.index over that flat list
+    instead of reading txn["id"] from every dictionary.
     """
+    if ids is not None:
+        try:
+            return transactions_list[ids.index(txn_id)]
+        except ValueError:
+            return None
+
     for txn in transactions_list:
         if txn["id"] == txn_id:
             return txn
@@ -99,6 +164,8 @@ def linear_search_by_id(transactions_list, txn_id):
 def run_dsa_comparison(transactions):
     """
     Runs all three search methods and prints timing results side-by-side.
+    Linear and binary search are each timed twice: the hand-written loop
+    and the C-backed variant (list.index / bisect).
     """
     print("\n" + "=" * 60)
     print("  DSA COMPARISON: Search Algorithm Performance")
@@ -106,45 +173,64 @@ def run_dsa_comparison(transactions):
 
     # Setup
     txn_dict = {txn["id"]: txn for txn in transactions}
+    ids = [txn["id"] for txn in transactions]
     sorted_by_amount = sorted(transactions, key=lambda x: x["amount"])
+    amounts = [txn["amount"] for txn in sorted_by_amount]
 
     search_id = transactions[-1]["id"]
     search_amount = transactions[-1]["amount"]
 
-    # Test 1: Linear Search
+    # Each loop iterates over repeat(None, n) rather than range(n), like
+    # timeit does, so no loop counter objects are created and the timings
+    # measure the searches themselves rather than loop overhead
+
+    # Test 1: Linear Search (hand-written loop)
     start = time.perf_counter()
-    for _ in range(10000):
+    for _ in repeat(None, BENCHMARK_ITERATIONS):
         linear_search_by_id(transactions, search_id)
     linear_time = time.perf_counter() - start
 
-    # Test 2: Dictionary Lookup
+    # Test 2: Linear Search (list.index over the pre-extracted IDs)
+    start = time.perf_counter()
+    for _ in repeat(None, BENCHMARK_ITERATIONS):
+        linear_search_by_id(transactions, search_id, ids)
+    index_time = time.perf_counter() - start
+
+    # Test 3: Dictionary Lookup
     start = time.perf_counter()
-    for _ in range(10000):
+    for _ in repeat(None, BENCHMARK_ITERATIONS):
         dict_lookup_by_id(txn_dict, search_id)
     dict_time = time.perf_counter() - start
 
-    # Test 3: Binary Search
+    # Test 4: Binary Search (hand-written loop)
     start = time.perf_counter()
-    for _ in range(10000):
+    for _ in repeat(None, BENCHMARK_ITERATIONS):
         binary_search_by_amount(sorted_by_amount, search_amount)
     binary_time = time.perf_counter() - start
 
-    # Results
+    # Test 5: Binary Search (bisect over the pre-extracted amounts)
+    start = time.perf_counter()
+    for _ in repeat(None, BENCHMARK_ITERATIONS):
+        binary_search_by_amount(sorted_by_amount, search_amount, amounts)
+    bisect_time = time.perf_counter() - start
+
+    # Results — (method, time, complexity)
+    results = [
+        ("Linear Search (by ID)", linear_time, "O(n)"),
+        ("Linear Search (list.index)", index_time, "O(n)"),
+        ("Dictionary Lookup (by ID)", dict_time, "O(1)"),
+        ("Binary Search (by amount)", binary_time, "O(log n)"),
+        ("Binary Search (bisect)", bisect_time, "O(log n)"),
+    ]
+
     print(f"\n  Searching for ID={search_id} and Amount={search_amount}")
-    print(f"  Each test runs 10,000 iterations\n")
+    print(f"  Each test runs {BENCHMARK_ITERATIONS:,} iterations\n")
     print(f"  {'Method':<30} {'Time (seconds)':<15} {'Complexity'}")
     print(f"  {'-'*30} {'-'*15} {'-'*12}")
-    print(f"  {'Linear Search (by ID)':<30} {linear_time:<15.6f} {'O(n)'}")
-    print(f"  {'Dictionary Lookup (by ID)':<30} {dict_time:<15.6f} {'O(1)'}")
-    print(f"  {'Binary Search (by amount)':<30} {binary_time:<15.6f} {'O(log n)'}")
-
-    fastest = min(linear_time, dict_time, binary_time)
-    if fastest == dict_time:
-        winner = "Dictionary Lookup"
-    elif fastest == binary_time:
-        winner = "Binary Search"
-    else:
-        winner = "Linear Search"
+    for method, elapsed, complexity in results:
+        print(f"  {method:<30} {elapsed:<15.6f} {complexity}")
+
+    winner = min(results, key=lambda result: result[1])[0]
 
     print(f"\n  Winner: {winner}")
     print("=" * 60)